@@ -8,37 +8,50 @@ This service handles:
 - Predictive analytics
 """
 
-import os
-import sys
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Dict, Optional
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from shared.config import settings  # noqa: E402
-from shared.database import health_check as db_health  # noqa: E402
-from shared.redis_client import redis_health_check  # noqa: E402
+from shared.config import settings
+from shared.database import health_check as db_health
+from shared.executor import shutdown_probe_executor
+from shared.redis_client import redis_health_check
 
 app = FastAPI(
     title="EduConnect Analytics Service",
     description="Data processing and analytics service",
     version="0.1.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+)
+app.add_event_handler("shutdown", shutdown_probe_executor)
+
+
+# Static response bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": settings.service_name})
+_ROOT_BODY = orjson.dumps(
+    {"service": "Analytics Service", "version": "0.1.0", "status": "operational"}
 )
 
 
 # Models
 class Event(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     event_type: str
     event_data: Dict
-    timestamp: datetime = datetime.utcnow()
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class ProgressQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     course_id: Optional[str] = None
     start_date: Optional[datetime] = None
@@ -47,29 +60,27 @@ class ProgressQuery(BaseModel):
 
 # Health endpoints
 @app.get("/health")
-async def health() -> Dict[str, str]:
-    return {"status": "ok", "service": settings.service_name}
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/ready")
+@app.get("/ready", response_model=None)
 async def ready() -> Dict[str, bool | str]:
-    db_ok = await db_health()
-    redis_ok = await redis_health_check()
+    db_ok, redis_ok = await asyncio.gather(db_health(), redis_health_check())
 
     if not db_ok or not redis_ok:
-        raise HTTPException(status_code=503, detail="Service not ready")
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "not ready", "database": db_ok, "redis": redis_ok},
+        )
 
     return {"status": "ready", "database": db_ok, "redis": redis_ok}
 
 
 # API Endpoints
 @app.get("/")
-async def root() -> Dict[str, str]:
-    return {
-        "service": "Analytics Service",
-        "version": "0.1.0",
-        "status": "operational",
-    }
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.post("/events")
@@ -114,4 +125,9 @@ async def get_insights(user_id: str) -> Dict[str, str | list]:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        access_log=False,
+    )
@@ -0,0 +1,18 @@
+"""
+Event model tests for analytics service.
+"""
+
+import time
+
+from main import Event
+
+
+def test_event_timestamps_are_per_instance() -> None:
+    """Test each event gets its own timezone-aware timestamp."""
+    first = Event(user_id="u1", event_type="login", event_data={})
+    time.sleep(0.001)
+    second = Event(user_id="u1", event_type="login", event_data={})
+
+    assert first.timestamp.tzinfo is not None
+    assert second.timestamp.tzinfo is not None
+    assert first.timestamp != second.timestamp
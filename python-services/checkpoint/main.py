@@ -7,25 +7,34 @@ This service handles:
 - Difficulty calibration
 """
 
-import os
-import sys
+import asyncio
 from enum import Enum
 from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from shared.config import settings  # noqa: E402
-from shared.database import health_check as db_health  # noqa: E402
-from shared.redis_client import redis_health_check  # noqa: E402
+from shared.config import settings
+from shared.database import health_check as db_health
+from shared.executor import shutdown_probe_executor
+from shared.redis_client import redis_health_check
 
 app = FastAPI(
     title="EduConnect Checkpoint Service",
     description="Assessment generation and scoring service",
     version="0.1.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+)
+app.add_event_handler("shutdown", shutdown_probe_executor)
+
+
+# Static response bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": settings.service_name})
+_ROOT_BODY = orjson.dumps(
+    {"service": "Checkpoint Service", "version": "0.1.0", "status": "operational"}
 )
 
 
@@ -44,6 +53,8 @@ class DifficultyLevel(str, Enum):
 
 
 class QuestionGenerationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content_id: str
     question_type: QuestionType
     difficulty: DifficultyLevel
@@ -51,6 +62,8 @@ class QuestionGenerationRequest(BaseModel):
 
 
 class Question(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: QuestionType
     difficulty: DifficultyLevel
@@ -60,6 +73,8 @@ class Question(BaseModel):
 
 
 class SubmissionScore(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     submission_id: str
     score: float
     max_score: float
@@ -68,29 +83,27 @@ class SubmissionScore(BaseModel):
 
 # Health endpoints
 @app.get("/health")
-async def health() -> Dict[str, str]:
-    return {"status": "ok", "service": settings.service_name}
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/ready")
+@app.get("/ready", response_model=None)
 async def ready() -> Dict[str, bool | str]:
-    db_ok = await db_health()
-    redis_ok = await redis_health_check()
+    db_ok, redis_ok = await asyncio.gather(db_health(), redis_health_check())
 
     if not db_ok or not redis_ok:
-        raise HTTPException(status_code=503, detail="Service not ready")
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "not ready", "database": db_ok, "redis": redis_ok},
+        )
 
     return {"status": "ready", "database": db_ok, "redis": redis_ok}
 
 
 # API Endpoints
 @app.get("/")
-async def root() -> Dict[str, str]:
-    return {
-        "service": "Checkpoint Service",
-        "version": "0.1.0",
-        "status": "operational",
-    }
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.post("/generate", response_model=List[Question])
@@ -116,4 +129,9 @@ async def score_submission(submission_id: str, answers: Dict) -> SubmissionScore
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        access_log=False,
+    )
@@ -10,7 +10,7 @@ from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -51,9 +51,9 @@ async def db_session():
         Base.metadata.drop_all(bind=test_engine)
 
 
-@pytest_asyncio.fixture
-async def client(db_session) -> AsyncGenerator:
-    """Create a test client for the FastAPI app"""
+@pytest.fixture(scope="session")
+def service_app():
+    """Import the FastAPI app of the service under test once per session"""
     # Determine which service we're testing from environment variable
     service_name = os.getenv("SERVICE_NAME", "analytics")
 
@@ -63,6 +63,21 @@ async def client(db_session) -> AsyncGenerator:
 
     from main import app
 
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client(service_app) -> AsyncGenerator:
+    """Create one HTTP client (and ASGI transport) shared by all tests"""
+    transport = ASGITransport(app=service_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def client(service_app, http_client, db_session) -> AsyncGenerator:
+    """Create a test client for the FastAPI app"""
+
     # Override database dependency
     async def override_get_db():
         try:
@@ -70,12 +85,11 @@ async def client(db_session) -> AsyncGenerator:
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    service_app.dependency_overrides[get_db] = override_get_db
 
-    async with AsyncClient(app=app, base_url="http://test") as test_client:
-        yield test_client
+    yield http_client
 
-    app.dependency_overrides.clear()
+    service_app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -7,19 +7,18 @@ This service handles:
 - Match quality optimization
 """
 
-import os
-import sys
+import asyncio
 from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-# Add parent directory to path for shared imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from shared.config import settings  # noqa: E402
-from shared.database import health_check as db_health  # noqa: E402
-from shared.redis_client import redis_health_check  # noqa: E402
+from shared.config import settings
+from shared.database import health_check as db_health
+from shared.executor import shutdown_probe_executor
+from shared.redis_client import redis_health_check
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -27,6 +26,15 @@ app = FastAPI(
     description="ML-based mentor-learner matching service",
     version="0.1.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+)
+app.add_event_handler("shutdown", shutdown_probe_executor)
+
+
+# Static response bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": settings.service_name})
+_ROOT_BODY = orjson.dumps(
+    {"service": "Matching Service", "version": "0.1.0", "status": "operational"}
 )
 
 
@@ -38,6 +46,8 @@ class MatchRequest(BaseModel):
 
 
 class MatchScore(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mentor_id: str
     compatibility_score: float
     availability_score: float
@@ -46,26 +56,27 @@ class MatchScore(BaseModel):
 
 
 class MatchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     learner_id: str
     matches: List[MatchScore]
 
 
 # Health endpoints
 @app.get("/health")
-async def health() -> Dict[str, str]:
-    return {
-        "status": "ok",
-        "service": settings.service_name,
-    }
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/ready")
+@app.get("/ready", response_model=None)
 async def ready() -> Dict[str, bool | str]:
-    db_ok = await db_health()
-    redis_ok = await redis_health_check()
+    db_ok, redis_ok = await asyncio.gather(db_health(), redis_health_check())
 
     if not db_ok or not redis_ok:
-        raise HTTPException(status_code=503, detail="Service not ready")
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "not ready", "database": db_ok, "redis": redis_ok},
+        )
 
     return {
         "status": "ready",
@@ -76,12 +87,8 @@ async def ready() -> Dict[str, bool | str]:
 
 # API Endpoints
 @app.get("/")
-async def root() -> Dict[str, str]:
-    return {
-        "service": "Matching Service",
-        "version": "0.1.0",
-        "status": "operational",
-    }
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.post("/match", response_model=MatchResponse)
@@ -114,4 +121,11 @@ async def score_match(learner_id: str, mentor_id: str) -> Dict[str, str | float]
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.web_concurrency,
+        log_level=settings.log_level.lower(),
+        access_log=False,
+    )
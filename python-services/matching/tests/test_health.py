@@ -25,3 +25,28 @@ async def test_ready_endpoint(client: AsyncClient) -> None:
     assert data["status"] == "ready"
     assert "database" in data
     assert "redis" in data
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_reports_failed_dependency(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test readiness endpoint returns 503 naming the unavailable dependency."""
+    import main
+
+    async def healthy() -> bool:
+        return True
+
+    async def unhealthy() -> bool:
+        return False
+
+    monkeypatch.setattr(main, "db_health", healthy)
+    monkeypatch.setattr(main, "redis_health_check", unhealthy)
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    detail = response.json()["detail"]
+    assert detail["status"] == "not ready"
+    assert detail["database"] is True
+    assert detail["redis"] is False
+
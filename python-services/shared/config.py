@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
     port: int = int(os.getenv("PORT", "8000"))
     host: str = os.getenv("HOST", "0.0.0.0")
+    # Also read by the uvicorn CLI, so it applies to the container CMD too
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Threads reserved for health probes, separate from asyncio's default executor
+    probe_pool_workers: int = int(os.getenv("PROBE_POOL_WORKERS", "2"))
 
     # Database
     database_url: str = os.getenv(
@@ -23,6 +27,9 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379")
     redis_password: Optional[str] = os.getenv("REDIS_PASSWORD")
+    redis_max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
+    redis_connect_timeout: float = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+    redis_health_check_interval: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
 
     # Model cache
     model_cache_dir: str = os.getenv("MODEL_CACHE_DIR", "./models")
@@ -7,6 +7,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from .config import settings
+from .executor import run_probe
 
 # Create database engine
 engine = create_engine(
@@ -29,12 +30,17 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _probe() -> bool:
+    """Run a trivial query on a pooled connection (blocking)"""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return True
+
+
 async def health_check() -> bool:
     """Check if database is accessible"""
     try:
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-        return True
+        return await run_probe(_probe)
     except Exception as e:
         print(f"Database health check failed: {e}")
         return False
@@ -0,0 +1,41 @@
+"""Dedicated thread pool for health probes in Python microservices"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from .config import settings
+
+T = TypeVar("T")
+
+_probe_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_probe_executor() -> ThreadPoolExecutor:
+    """Get the probe thread pool, creating it on first use"""
+    global _probe_executor
+
+    if _probe_executor is None:
+        _probe_executor = ThreadPoolExecutor(
+            max_workers=settings.probe_pool_workers, thread_name_prefix="educonnect-probe"
+        )
+
+    return _probe_executor
+
+
+async def run_probe(func: Callable[[], T]) -> T:
+    """Run a blocking probe off the event loop, isolated from the default executor
+
+    Work sent through asyncio.to_thread can saturate the loop's default
+    executor; probes on this pool still answer while that happens.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_get_probe_executor(), func)
+
+
+def shutdown_probe_executor() -> None:
+    """Shut down the probe thread pool, waiting for in-flight probes"""
+    global _probe_executor
+
+    if _probe_executor:
+        _probe_executor.shutdown(wait=True)
+        _probe_executor = None
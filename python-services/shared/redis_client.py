@@ -14,12 +14,18 @@ async def get_redis() -> aioredis.Redis:
     global _redis_client
 
     if _redis_client is None:
-        _redis_client = await aioredis.from_url(
+        # Plain ConnectionPool: BlockingConnectionPool in redis 5.0.1 deadlocks and leaks
+        # a connection whenever a connect attempt fails
+        pool = aioredis.ConnectionPool.from_url(
             settings.redis_url,
             password=settings.redis_password,
+            max_connections=settings.redis_max_connections,
+            socket_connect_timeout=settings.redis_connect_timeout,
+            health_check_interval=settings.redis_health_check_interval,
             encoding="utf-8",
             decode_responses=True,
         )
+        _redis_client = aioredis.Redis(connection_pool=pool)
 
     return _redis_client
 
@@ -29,7 +35,7 @@ async def close_redis() -> None:
     global _redis_client
 
     if _redis_client:
-        await _redis_client.close()
+        await _redis_client.aclose(close_connection_pool=True)
         _redis_client = None
 
 
@@ -0,0 +1,52 @@
+"""
+Tests for the shared health-probe thread pool.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from shared import executor
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+def test_probe_runs_while_default_executor_is_saturated() -> None:
+    """Test probes still answer when every default-executor thread is busy."""
+    release = threading.Event()
+
+    async def scenario() -> str:
+        # Private loop with a one-thread default executor, then occupy that thread
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+        blocker = asyncio.ensure_future(asyncio.to_thread(release.wait))
+        await asyncio.sleep(0)
+        try:
+            return await asyncio.wait_for(executor.run_probe(_thread_name), timeout=1)
+        finally:
+            release.set()
+            await blocker
+
+    try:
+        thread_name = asyncio.run(scenario())
+    finally:
+        executor.shutdown_probe_executor()
+
+    assert thread_name.startswith("educonnect-probe")
+
+
+def test_probe_after_shutdown_uses_a_fresh_pool() -> None:
+    """Test shutdown waits for probes and later probes still run."""
+
+    async def scenario() -> str:
+        await executor.run_probe(_thread_name)
+        executor.shutdown_probe_executor()
+        return await executor.run_probe(_thread_name)
+
+    try:
+        thread_name = asyncio.run(scenario())
+    finally:
+        executor.shutdown_probe_executor()
+
+    assert thread_name.startswith("educonnect-probe")
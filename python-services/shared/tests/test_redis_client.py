@@ -0,0 +1,53 @@
+"""
+Tests for the shared Redis client.
+"""
+
+import time
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from shared import redis_client
+from shared.config import settings
+
+# Nothing listens here, so connects are refused immediately
+UNREACHABLE_REDIS_URL = "redis://localhost:1"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_fails_fast_without_leaking_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test refused connects fail at once and are returned to the pool."""
+    monkeypatch.setattr(settings, "redis_url", UNREACHABLE_REDIS_URL)
+    monkeypatch.setattr(settings, "redis_max_connections", 3)
+    monkeypatch.setattr(redis_client, "_redis_client", None)
+
+    client = await redis_client.get_redis()
+    try:
+        # More attempts than the pool holds: a leaked connection would surface
+        # as "Too many connections" instead of the refused connect
+        for _ in range(settings.redis_max_connections + 2):
+            start = time.monotonic()
+            with pytest.raises(RedisConnectionError) as exc_info:
+                await client.ping()
+            assert time.monotonic() - start < 0.5
+            assert "Too many connections" not in str(exc_info.value)
+    finally:
+        await redis_client.close_redis()
+
+
+@pytest.mark.asyncio
+async def test_redis_health_check_fails_fast_when_unreachable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the health check reports an unreachable Redis without waiting."""
+    monkeypatch.setattr(settings, "redis_url", UNREACHABLE_REDIS_URL)
+    monkeypatch.setattr(redis_client, "_redis_client", None)
+
+    try:
+        start = time.monotonic()
+        assert await redis_client.redis_health_check() is False
+        assert time.monotonic() - start < 0.5
+    finally:
+        await redis_client.close_redis()